@@ -18,16 +18,22 @@
 
 """GUI entry point"""
 
-from PySide6 import QtWidgets
+from PySide6 import QtGui, QtWidgets
 
 import sys
 
 from .window import Window
 
+# Item caches live in the global QPixmapCache (in KiB)
+_PIXMAP_CACHE_LIMIT = 65536
+
 
 def run():
     app = QtWidgets.QApplication(sys.argv)
-    window = Window()
+    if QtGui.QPixmapCache.cacheLimit() < _PIXMAP_CACHE_LIMIT:
+        QtGui.QPixmapCache.setCacheLimit(_PIXMAP_CACHE_LIMIT)
+
+    window = Window(opengl="--opengl" in sys.argv)
     window.show()
 
     sys.exit(app.exec())
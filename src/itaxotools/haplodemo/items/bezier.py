@@ -58,6 +58,11 @@ class BezierHandle(HighlightableItem, SoloMovableItem, QtWidgets.QGraphicsEllips
         self.setPos(point.x(), point.y())
         self.setZValue(90)
 
+    @override
+    def boundingRect(self):
+        # Highlighted handles are drawn larger than their rect
+        return self.rect().adjusted(-4, -4, 4, 4)
+
     @override
     def itemChange(self, change, value):
         if change == QtWidgets.QGraphicsItem.ItemPositionHasChanged:
@@ -158,6 +163,7 @@ class BezierCurve(HighlightableItem, QtWidgets.QGraphicsPathItem):
     @override
     def paint(self, painter, options, widget=None):
         painter.save()
+        painter.setBrush(QtCore.Qt.NoBrush)
         if self.is_highlighted():
             painter.setPen(self._pen_high)
             painter.drawPath(self.path())
@@ -193,6 +199,7 @@ class BezierCurve(HighlightableItem, QtWidgets.QGraphicsPathItem):
         self._pen_shape = QtGui.QPen(
             QtCore.Qt.black, self._pen_width + self._pen_high_increment * 2
         )
+        self.setPen(self._pen_shape)
         self.update()
 
     def get_control_point_for_node(self, node):
@@ -20,9 +20,11 @@ from __future__ import annotations
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
+from math import hypot
+
 from itaxotools.common.utility import override
 
-from ..utility import shapeFromPath
+from ..utility import DEFAULT_PEN, shapeFromPath
 from .labels import Label
 from .protocols import HighlightableItem
 from .types import EdgeDecoration, EdgeStyle
@@ -35,6 +37,8 @@ class Edge(HighlightableItem, QtWidgets.QGraphicsLineItem):
         super().__init__()
         self.setAcceptedMouseButtons(QtCore.Qt.LeftButton)
         self.setCursor(QtCore.Qt.ArrowCursor)
+        self.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
+        self.setFlag(QtWidgets.QGraphicsItem.ItemUsesExtendedStyleOption, True)
         self.weight = weight
         self.segments = weight
         self.node1 = node1
@@ -46,11 +50,16 @@ class Edge(HighlightableItem, QtWidgets.QGraphicsLineItem):
         self.locked_label_pos = None
         self.locked_label_rect_pos = None
 
-        self._pen = QtGui.QPen(QtCore.Qt.black, 2)
+        self._pen = DEFAULT_PEN
         self._pen_high = QtGui.QPen(self.highlight_color(), 4)
         self._pen_high_increment = 4
         self._pen_width = 2
 
+        self._bounding_rect = None
+        self._shape = None
+        self._dots = None
+        self.update_geometry()
+
         self.label = Label(str(weight), self)
         self.label.set_white_outline(True)
         self.set_style(EdgeStyle.Bubbles)
@@ -59,6 +68,11 @@ class Edge(HighlightableItem, QtWidgets.QGraphicsLineItem):
 
     @override
     def shape(self):
+        if self._shape is None:
+            self._shape = self.get_shape()
+        return self._shape
+
+    def get_shape(self):
         line = self.line()
         path = QtGui.QPainterPath()
         if line == QtCore.QLineF():
@@ -85,13 +99,18 @@ class Edge(HighlightableItem, QtWidgets.QGraphicsLineItem):
 
     @override
     def boundingRect(self):
-        # Expand to account for segment dots
-        return super().boundingRect().adjusted(-5, -5, 5, 5)
+        return self._bounding_rect
+
+    def update_geometry(self):
+        # Expand to account for highlighted dots and bars,
+        # otherwise they are clipped by the item cache
+        m = 8 + self._pen_width * 1.5
+        self._bounding_rect = super().boundingRect().adjusted(-m, -m, m, m)
+        self._shape = None
+        self._dots = None
 
     @override
     def paint(self, painter, options, widget=None):
-        painter.save()
-
         if self.is_highlighted():
             self.paintHoverLine(painter)
 
@@ -101,21 +120,17 @@ class Edge(HighlightableItem, QtWidgets.QGraphicsLineItem):
         painter.drawLine(self.line())
 
         if self.style.decoration == EdgeDecoration.Bubbles:
-            self.paintBubbles(painter)
+            self.paintBubbles(painter, options.exposedRect)
         elif self.style.decoration == EdgeDecoration.Bars:
             self.paintBars(painter)
         elif self.style.decoration == EdgeDecoration.DoubleStrike:
             self.paintDoubleStrike(painter)
 
-        painter.restore()
-
     def paintHoverLine(self, painter):
-        painter.save()
         painter.setPen(self._pen_high)
         painter.drawLine(self.line())
-        painter.restore()
 
-    def paintBubbles(self, painter):
+    def paintBubbles(self, painter, exposed: QtCore.QRectF):
         if self.segments <= 1:
             return
 
@@ -128,19 +143,25 @@ class Edge(HighlightableItem, QtWidgets.QGraphicsLineItem):
             self.paintError(painter)
             return
 
-        for dot in range(1, self.segments):
-            point = line.pointAt(dot / self.segments)
-            point = QtCore.QPointF(point)
-            # Unless we use QPointF, bubble size isn't right
-            self.paintBubble(painter, point, radius, radius_high)
+        if self._dots is None:
+            self._dots = [
+                line.pointAt(dot / self.segments) for dot in range(1, self.segments)
+            ]
+
+        # Long edges are often only partially exposed
+        left = exposed.left() - radius_high
+        right = exposed.right() + radius_high
+        top = exposed.top() - radius_high
+        bottom = exposed.bottom() + radius_high
+        for point in self._dots:
+            if left <= point.x() <= right and top <= point.y() <= bottom:
+                self.paintBubble(painter, point, radius, radius_high)
 
     def paintBubble(self, painter, point, r=2.5, h=6):
         painter.setPen(QtCore.Qt.NoPen)
         if self.is_highlighted():
-            painter.save()
             painter.setBrush(self.highlight_color())
             painter.drawEllipse(point, h, h)
-            painter.restore()
         painter.setBrush(QtCore.Qt.black)
         painter.drawEllipse(point, r, r)
 
@@ -203,36 +224,19 @@ class Edge(HighlightableItem, QtWidgets.QGraphicsLineItem):
         bar = QtCore.QLineF(bar.pointAt(-1), bar.pointAt(1))
 
         if self.is_highlighted():
-            painter.save()
-            pen = QtGui.QPen(self.highlight_color(), 6)
-            painter.setPen(pen)
+            painter.setPen(self._pen_bar_high)
             painter.drawLine(bar)
-            painter.restore()
+            painter.setPen(self._pen)
         painter.drawLine(bar)
 
     def paintError(self, painter):
-        radius = self._pen_width * 2 + 0.5
-        radius_high = radius + self._pen_high_increment
-
-        painter.save()
         line = self.line()
         if self.is_highlighted():
-            pen = QtGui.QPen(
-                self.highlight_color(),
-                radius_high,
-                QtCore.Qt.SolidLine,
-                QtCore.Qt.RoundCap,
-            )
-            painter.setPen(pen)
+            painter.setPen(self._pen_error_high)
             painter.drawLine(line)
-        pen = QtGui.QPen(
-            QtCore.Qt.black, radius, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap
-        )
-        painter.setPen(pen)
+        painter.setPen(self._pen_error)
         painter.drawLine(line)
 
-        painter.restore()
-
     def update_z_value(self, hover=False):
         z = -21 if hover else -22
         self.setZValue(z)
@@ -258,7 +262,9 @@ class Edge(HighlightableItem, QtWidgets.QGraphicsLineItem):
         self.update_pens()
 
     def set_pen_width(self, value):
+        self.prepareGeometryChange()
         self._pen_width = value
+        self.update_geometry()
         self.update_pens()
 
     def update_pens(self):
@@ -272,6 +278,19 @@ class Edge(HighlightableItem, QtWidgets.QGraphicsLineItem):
         self._pen_high = QtGui.QPen(
             self.highlight_color(), self._pen_width + self._pen_high_increment
         )
+        self._pen_bar_high = QtGui.QPen(self.highlight_color(), 6)
+
+        radius = self._pen_width * 2 + 0.5
+        radius_high = radius + self._pen_high_increment
+        self._pen_error = QtGui.QPen(
+            QtCore.Qt.black, radius, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap
+        )
+        self._pen_error_high = QtGui.QPen(
+            self.highlight_color(),
+            radius_high,
+            QtCore.Qt.SolidLine,
+            QtCore.Qt.RoundCap,
+        )
         self.update()
 
     def reset_label_position(self, offset: bool | None):
@@ -320,7 +339,7 @@ class Edge(HighlightableItem, QtWidgets.QGraphicsLineItem):
 
         rpos = self.locked_label_rect_pos
         rpos = transform.map(rpos)
-        rect = self.label.rect
+        rect = QtCore.QRect(self.label.rect)
         rect.moveCenter((rpos - pos).toPoint())
         self.label.setRect(rect)
 
@@ -330,26 +349,29 @@ class Edge(HighlightableItem, QtWidgets.QGraphicsLineItem):
         rad1 = self.node1.radius
         rad2 = self.node2.radius
 
-        line = QtCore.QLineF(pos1, pos2)
-        length = line.length()
+        x1 = pos1.x()
+        y1 = pos1.y()
+        dx = pos2.x() - x1
+        dy = pos2.y() - y1
+        length = hypot(dx, dy)
 
-        if length < (rad1 + rad2):
+        if not length or length < (rad1 + rad2):
             self.hide()
             return
         self.show()
 
-        line.setLength(length - rad1 - rad2 + 2)
-
-        unit = line.unitVector()
-        unit.setLength(rad1 - 1)
-        unit.translate(-unit.x1(), -unit.y1())
-
-        line.translate(unit.x2(), unit.y2())
-
-        center = line.center()
-        self.setPos(center)
-        line.translate(-center)
-        self.setLine(line)
+        # Scalar math, this is called for every edge on every node move
+        ux = dx / length
+        uy = dy / length
+        start = rad1 - 1
+        end = length - rad2 + 1
+        cx = x1 + ux * (start + end) / 2
+        cy = y1 + uy * (start + end) / 2
+        half = (end - start) / 2
+
+        self.setPos(cx, cy)
+        self.setLine(-ux * half, -uy * half, ux * half, uy * half)
+        self.update_geometry()
 
         if self.label.isVisible():
             self.adjust_label_position()
@@ -20,33 +20,46 @@ from PySide6 import QtCore, QtGui, QtWidgets
 
 from itaxotools.common.utility import override
 
+from ..utility import LABEL_FONT
 from .protocols import HighlightableItem, HoverableItem
 from .types import Direction
 
+_TEXT_PEN = QtGui.QPen(QtGui.QColor("black"))
+
+
+def _outline_pen(color) -> QtGui.QPen:
+    return QtGui.QPen(
+        color, 4, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin
+    )
+
+
+_WHITE_OUTLINE_PEN = _outline_pen(QtCore.Qt.white)
+_WHITE_OUTLINE_BRUSH = QtGui.QBrush(QtCore.Qt.white)
+
 
 class Label(HighlightableItem, QtWidgets.QGraphicsItem):
     def __init__(self, text, parent):
         super().__init__(parent)
         self._white_outline = False
+        self._pen_high = _outline_pen(self.highlight_color())
+        self._brush_high = QtGui.QBrush(self.highlight_color())
         self._anchor = Direction.Center
         self._debug = False
 
-        font = QtGui.QFont()
-        font.setPixelSize(16)
-        font.setFamily("Arial")
-        font.setHintingPreference(QtGui.QFont.PreferNoHinting)
-        self.font = font
+        self.font = LABEL_FONT
 
         self.text = text
         self.rect = self.getTextRect()
+        self._painted_rect = self.rect
         self.outline = self.getTextOutline()
+        self.update_static_text()
 
         self.locked_rect = self.rect
         self.locked_pos = QtCore.QPointF(0, 0)
 
         self.setCursor(QtCore.Qt.ArrowCursor)
+        self.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
         self.setFlag(QtWidgets.QGraphicsItem.ItemIsMovable, False)
-        self.setFlag(QtWidgets.QGraphicsItem.ItemSendsGeometryChanges, True)
         self.setAcceptedMouseButtons(QtCore.Qt.LeftButton)
 
     @override
@@ -93,7 +106,7 @@ class Label(HighlightableItem, QtWidgets.QGraphicsItem):
     @override
     def boundingRect(self):
         try:
-            return QtCore.QRect(self.rect)
+            return QtCore.QRect(self._painted_rect)
         except Exception as e:
             print(self, vars(self))
             raise e
@@ -101,21 +114,18 @@ class Label(HighlightableItem, QtWidgets.QGraphicsItem):
     @override
     def shape(self):
         path = QtGui.QPainterPath()
-        path.addRect(self.rect)
+        path.addRect(self._painted_rect)
         return path
 
     @override
     def paint(self, painter, options, widget=None):
-        painter.save()
-
-        pos = QtGui.QFontMetrics(self.font).boundingRect(self.text).center()
-        pos -= self.rect.center()
+        pos = self._static_text_center - self._painted_rect.center()
         painter.translate(-pos)
 
         self.paint_outline(painter)
         self.paint_text(painter)
 
-        painter.restore()
+        painter.translate(pos)
 
         if self._debug:
             painter.setPen(QtCore.Qt.green)
@@ -129,24 +139,26 @@ class Label(HighlightableItem, QtWidgets.QGraphicsItem):
             or self.parentItem()
             and self.parentItem().isSelected()
         ):
-            color = self.highlight_color()
+            painter.setPen(self._pen_high)
+            painter.setBrush(self._brush_high)
         elif self._white_outline:
-            color = QtCore.Qt.white
+            painter.setPen(_WHITE_OUTLINE_PEN)
+            painter.setBrush(_WHITE_OUTLINE_BRUSH)
         else:
             return
-        pen = QtGui.QPen(
-            color, 4, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin
-        )
-        painter.setPen(pen)
-        painter.setBrush(QtGui.QBrush(color))
         painter.drawPath(self.outline)
 
     def paint_text(self, painter):
-        pen = QtGui.QPen(QtGui.QColor("black"))
-        painter.setPen(pen)
+        painter.setPen(_TEXT_PEN)
         painter.setBrush(QtCore.Qt.NoBrush)
         painter.setFont(self.font)
-        painter.drawText(0, 0, self.text)
+        painter.drawStaticText(self._static_text_pos, self._static_text)
+
+    @override
+    def set_highlight_color(self, value):
+        self._pen_high = _outline_pen(value)
+        self._brush_high = QtGui.QBrush(value)
+        super().set_highlight_color(value)
 
     def set_white_outline(self, value):
         self._white_outline = value
@@ -161,14 +173,24 @@ class Label(HighlightableItem, QtWidgets.QGraphicsItem):
         font.setHintingPreference(QtGui.QFont.PreferNoHinting)
         self.font = font
         self.outline = self.getTextOutline()
+        self.update_static_text()
         self.recenter()
+        self.update()
 
     def set_anchor(self, value):
         self._anchor = value
 
     def setRect(self, rect):
-        self.prepareGeometryChange()
+        if rect == self.rect:
+            return
         self.rect = rect
+        if rect.size() != self._painted_rect.size():
+            self.prepareGeometryChange()
+            self._painted_rect = rect
+            self.update()
+        # Plain moves shift the item instead, so the cached pixmap is reused
+        offset = rect.center() - self._painted_rect.center()
+        self.setTransform(QtGui.QTransform.fromTranslate(offset.x(), offset.y()))
 
     def getTextRect(self):
         match self._anchor:
@@ -203,6 +225,18 @@ class Label(HighlightableItem, QtWidgets.QGraphicsItem):
         path.addText(0, 0, self.font, self.text)
         return path
 
+    def update_static_text(self):
+        # Text layout is done once here instead of on every paint
+        metrics = QtGui.QFontMetricsF(self.font)
+        static = QtGui.QStaticText(self.text)
+        static.setTextFormat(QtCore.Qt.PlainText)
+        static.prepare(QtGui.QTransform(), self.font)
+        self._static_text = static
+        self._static_text_pos = QtCore.QPointF(0, -metrics.ascent())
+        self._static_text_center = (
+            QtGui.QFontMetrics(self.font).boundingRect(self.text).center()
+        )
+
     def recenter(self):
         rect = self.getTextRect()
         self.setRect(rect)
@@ -210,8 +244,11 @@ class Label(HighlightableItem, QtWidgets.QGraphicsItem):
     def setText(self, text):
         self.text = text
         self.outline = self.getTextOutline()
+        self.update_static_text()
         rect = self.getTextRect()
         self.setRect(rect)
+        # The cached pixmap is not redrawn on its own if the size is the same
+        self.update()
 
     def post_label_movement(self):
         if not self.scene():
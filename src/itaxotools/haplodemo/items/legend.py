@@ -20,8 +20,11 @@ from PySide6 import QtCore, QtGui, QtWidgets
 
 from itaxotools.common.utility import override
 
+from ..utility import LABEL_FONT, colorFromString
 from .protocols import HighlightableItem, SoloMovableItemWithHistory
 
+_LEGEND_PEN = QtGui.QPen(QtCore.Qt.black, 1)
+
 
 class LegendBubble(QtWidgets.QGraphicsEllipseItem):
     def __init__(self, x, y, r, color, parent=None):
@@ -37,12 +40,7 @@ class LegendLabel(QtWidgets.QGraphicsSimpleTextItem):
     def __init__(self, x, y, text, parent=None):
         super().__init__(text, parent)
         self.setPos(x, y)
-
-        font = QtGui.QFont()
-        font.setPixelSize(16)
-        font.setFamily("Arial")
-        font.setHintingPreference(QtGui.QFont.PreferNoHinting)
-        self.setFont(font)
+        self.setFont(LABEL_FONT)
 
 
 class LegendItem(QtWidgets.QGraphicsItem):
@@ -63,7 +61,7 @@ class LegendItem(QtWidgets.QGraphicsItem):
         pass
 
     def update_color(self, color_map):
-        color = QtGui.QColor(color_map[self.key])
+        color = colorFromString(color_map[self.key])
         self.bubble.setBrush(color)
 
     def set_label_font(self, font):
@@ -87,6 +85,7 @@ class Legend(
         self.setRect(0, 0, 50, 50)
 
         self._pen_width = 1
+        self._pen_high = QtGui.QPen(self.highlight_color(), 4)
 
         self.font = QtGui.QFont()
         self.divisions = []
@@ -101,12 +100,16 @@ class Legend(
 
     @override
     def set_hovered(self, hovered):
-        if hovered:
-            self.setPen(QtGui.QPen(self.highlight_color(), 4))
-        else:
-            self.setPen(QtGui.QPen(QtCore.Qt.black, 1))
+        self.setPen(self._pen_high if hovered else _LEGEND_PEN)
         super().set_hovered(hovered)
 
+    @override
+    def set_highlight_color(self, value):
+        self._pen_high = QtGui.QPen(value, 4)
+        if self.is_hovered():
+            self.setPen(self._pen_high)
+        super().set_highlight_color(value)
+
     def update_sizes(self):
         metric = QtGui.QFontMetrics(self.font)
         height = metric.height()
@@ -168,7 +171,7 @@ class Legend(
                 self.margin + self.radius,
                 self.margin + self.radius + index * (self.radius * 2 + self.padding),
                 self.radius,
-                QtGui.QColor(division.color),
+                colorFromString(division.color),
                 division.key,
                 parent=self,
             )
@@ -24,6 +24,7 @@ from typing import Callable
 
 from itaxotools.common.utility import override
 
+from ..utility import DEFAULT_PEN, brushFromString
 from .bezier import BezierCurve
 from .boxes import RectBox
 from .edges import Edge
@@ -37,6 +38,7 @@ class Vertex(HighlightableItem, QtWidgets.QGraphicsEllipseItem):
 
         self.name = name
         self.parent = None
+        self.parent_edge = None
         self.boxes: list[RectBox] = []
         self.children: list[Vertex] = []
         self.siblings: list[Vertex] = []
@@ -67,15 +69,19 @@ class Vertex(HighlightableItem, QtWidgets.QGraphicsEllipseItem):
         self.in_scene_rotation = False
         self._pen_high_increment = 4
         self._pen_width = 2
-        self._pen = QtGui.QPen(QtCore.Qt.black, 2)
+        self._pen = DEFAULT_PEN
         self._debug = False
 
+        self._bounding_rect = None
+        self._shape = None
+        self.update_geometry()
+
         self.update_z_value()
 
         self.setCursor(QtCore.Qt.ArrowCursor)
+        self.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
         self.setFlag(QtWidgets.QGraphicsItem.ItemIsMovable, True)
         self.setFlag(QtWidgets.QGraphicsItem.ItemIsSelectable, True)
-        self.setFlag(QtWidgets.QGraphicsItem.ItemSendsGeometryChanges, True)
         self.setAcceptedMouseButtons(QtCore.Qt.LeftButton)
         self.setPen(QtCore.Qt.NoPen)
         self.setBrush(self.pen().color())
@@ -103,30 +109,23 @@ class Vertex(HighlightableItem, QtWidgets.QGraphicsEllipseItem):
         # Replicates Edge.paintBubble(), but can also be selected
         painter.setPen(QtCore.Qt.NoPen)
         if self.isSelected():
-            painter.save()
             painter.setPen(self._pen)
             painter.setBrush(self.highlight_color())
             painter.drawEllipse(point, h + r / 2, h + r / 2)
-            painter.restore()
+            painter.setPen(QtCore.Qt.NoPen)
         elif self.is_highlighted():
-            painter.save()
             painter.setBrush(self.highlight_color())
             painter.drawEllipse(point, h, h)
-            painter.restore()
         painter.setBrush(QtCore.Qt.black)
         painter.drawEllipse(point, r, r)
 
     @override
     def boundingRect(self):
-        # Hack to prevent drag n draw glitch
-        return self.rect().adjusted(-50, -50, 50, 50)
+        return self._bounding_rect
 
     @override
     def shape(self):
-        path = QtGui.QPainterPath()
-        x = self._pen_width + self._pen_high_increment * 1.4
-        path.addEllipse(self.rect().adjusted(-x, -x, x, x))
-        return path
+        return self._shape
 
     @override
     def itemChange(self, change, value):
@@ -137,8 +136,12 @@ class Vertex(HighlightableItem, QtWidgets.QGraphicsEllipseItem):
                 bezier.adjust_position()
             for edge in self.edges.values():
                 edge.adjust_position()
+            scene = self.scene()
             for box in self.boxes:
-                box.adjust_position()
+                if scene is None:
+                    box.adjust_position()
+                else:
+                    scene.schedule_box_adjustment(box)
         return super().itemChange(change, value)
 
     @override
@@ -199,11 +202,34 @@ class Vertex(HighlightableItem, QtWidgets.QGraphicsEllipseItem):
         z = 1 / (weight + 2)
         self.setZValue(z)
 
+    def get_paint_margin(self) -> float:
+        radius = self._pen_width * 1.5 + 1
+        return radius * 1.5 + self._pen_high_increment + self._pen_width / 2 + 1
+
+    def update_geometry(self):
+        rect = self.rect()
+
+        path = QtGui.QPainterPath()
+        x = self._pen_width + self._pen_high_increment * 1.4
+        path.addEllipse(rect.adjusted(-x, -x, x, x))
+        self._shape = path
+
+        m = self.get_paint_margin()
+        self._painted_rect = rect.adjusted(-m, -m, m, m)
+        self._bounding_rect = self._painted_rect.united(path.boundingRect())
+
+    def send_geometry_changes(self):
+        """Only vertices with attached items need to follow position changes"""
+        self.setFlag(QtWidgets.QGraphicsItem.ItemSendsGeometryChanges, True)
+
     def addChild(self, item, edge):
         item.parent = self
+        item.parent_edge = edge
         item.edges[self] = edge
         self.edges[item] = edge
         self.children.append(item)
+        self.send_geometry_changes()
+        item.send_geometry_changes()
         edge.adjust_position()
 
     def addSibling(self, item, edge):
@@ -211,14 +237,15 @@ class Vertex(HighlightableItem, QtWidgets.QGraphicsEllipseItem):
         self.edges[item] = edge
         self.siblings.append(item)
         item.siblings.append(self)
+        self.send_geometry_changes()
+        item.send_geometry_changes()
         edge.adjust_position()
 
     def set_hovered(self, value):
         if self.parent and any(
             (self.isMovementRotational(), self.isMovementRecursive())
         ):
-            edge = self.edges[self.parent]
-            edge.set_hovered(value)
+            self.parent_edge.set_hovered(value)
         self.update_z_value(value)
         super().set_hovered(value)
 
@@ -237,6 +264,7 @@ class Vertex(HighlightableItem, QtWidgets.QGraphicsEllipseItem):
         self._pen = QtGui.QPen(QtCore.Qt.black, value)
         self.prepareGeometryChange()
         self.setRect(-r, -r, 2 * r, 2 * r)
+        self.update_geometry()
 
     def isMovementRotational(self):
         if not self._rotational_setting:
@@ -456,17 +484,18 @@ class Node(Vertex):
         radius_for_weight: Callable[[int], float] = None,
     ):
         super().__init__(x, y, r, name)
-        self.weights = weights
+        self.set_weights(weights)
         self.radius_for_weight = radius_for_weight
-        self.pies = dict()
+        self.pies: list[tuple[QtGui.QBrush, int, int]] = []
+        self._pies_picture = None
 
-        self._pen = QtGui.QPen(QtCore.Qt.black, 2)
         self._pen_high = QtGui.QPen(self.highlight_color(), 4)
         self._pen_selected = QtGui.QPen(self.highlight_color(), 18)
         self._pen_high_increment = 2
         self._pen_width = 2
 
         self.label = Label(name, self)
+        self.setFlag(QtWidgets.QGraphicsItem.ItemUsesExtendedStyleOption, True)
         self.adjust_radius()
 
     @override
@@ -479,6 +508,13 @@ class Node(Vertex):
         super().hoverLeaveEvent(event)
         self.label.set_hovered(False)
 
+    @override
+    def itemChange(self, change, value):
+        if change == QtWidgets.QGraphicsItem.ItemSelectedHasChanged:
+            # Label outline depends on our selection state
+            self.label.update()
+        return super().itemChange(change, value)
+
     @override
     def mouseDoubleClickEvent(self, event):
         super().mouseDoubleClickEvent(event)
@@ -488,8 +524,13 @@ class Node(Vertex):
 
     @override
     def paint(self, painter, options, widget=None):
-        self.paint_node(painter)
-        self.paint_pies(painter)
+        if not options.exposedRect.intersects(self._painted_rect):
+            return
+
+        if self._pies_picture is not None:
+            painter.drawPicture(0, 0, self._pies_picture)
+        else:
+            self.paint_node(painter)
         self.paint_outline(painter)
 
         if self._debug:
@@ -499,35 +540,11 @@ class Node(Vertex):
             painter.drawLine(0, -4, 0, 4)
 
     def paint_node(self, painter):
-        painter.save()
-        if self.pies:
-            painter.setPen(QtCore.Qt.NoPen)
-        else:
-            painter.setPen(self._pen)
-        painter.setBrush(self.brush())
-        painter.drawEllipse(self.rect())
-        painter.restore()
-
-    def paint_pies(self, painter):
-        if not self.pies:
-            return
-        painter.save()
-
-        painter.setPen(QtCore.Qt.NoPen)
-        starting_angle = 16 * 90
-
-        for color, span in self.pies.items():
-            painter.setBrush(QtGui.QBrush(color))
-            painter.drawPie(self.rect(), starting_angle, span)
-            starting_angle += span
-
-        painter.setBrush(QtCore.Qt.NoBrush)
         painter.setPen(self._pen)
+        painter.setBrush(self.brush())
         painter.drawEllipse(self.rect())
-        painter.restore()
 
     def paint_outline(self, painter):
-        painter.save()
         painter.setBrush(QtCore.Qt.NoBrush)
 
         if self.isSelected():
@@ -538,25 +555,56 @@ class Node(Vertex):
         elif self.is_highlighted():
             painter.setPen(self._pen_high)
             painter.drawEllipse(self.rect())
-        painter.restore()
+
+    def set_weights(self, weights: dict[str, int]):
+        self.weights = weights
+        self._total_weight = sum(weights.values())
 
     def update_colors(self, color_map):
         if not self.weights:
-            self.setBrush(QtGui.QBrush(color_map[None]))
+            self.setBrush(brushFromString(color_map[None]))
             return
 
-        total_weight = sum(weight for weight in self.weights.values())
+        total_weight = self._total_weight
 
         weight_items = iter(self.weights.items())
         first_key, _ = next(weight_items)
         first_color = color_map[first_key]
-        self.setBrush(QtGui.QBrush(first_color))
+        self.setBrush(brushFromString(first_color))
 
-        self.pies = dict()
+        self.pies = []
+        starting_angle = 16 * 90
         for key, weight in weight_items:
-            color = color_map[key]
+            brush = brushFromString(color_map[key])
             span = int(5760 * weight / total_weight)
-            self.pies[color] = span
+            self.pies.append((brush, starting_angle, span))
+            starting_angle += span
+        self.update_pies_picture()
+        self.update()
+
+    def update_pies_picture(self):
+        if not self.pies:
+            self._pies_picture = None
+            return
+
+        picture = QtGui.QPicture()
+        painter = QtGui.QPainter(picture)
+
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(self.brush())
+        rect = self.rect()
+        painter.drawEllipse(rect)
+
+        for brush, starting_angle, span in self.pies:
+            painter.setBrush(brush)
+            painter.drawPie(rect, starting_angle, span)
+
+        painter.setBrush(QtCore.Qt.NoBrush)
+        painter.setPen(self._pen)
+        painter.drawEllipse(rect)
+
+        painter.end()
+        self._pies_picture = picture
 
     @override
     def set_highlight_color(self, value):
@@ -564,8 +612,14 @@ class Node(Vertex):
         self.label.set_highlight_color(value)
         self.update_pens()
 
+    @override
+    def get_paint_margin(self) -> float:
+        return (self._pen_width + self._pen_high_increment * 4) / 2 + 1
+
     def set_pen_width(self, value):
         self._pen_width = value
+        self.prepareGeometryChange()
+        self.update_geometry()
         self.update_pens()
 
     def update_pens(self):
@@ -576,6 +630,7 @@ class Node(Vertex):
         self._pen_selected = QtGui.QPen(
             self.highlight_color(), self._pen_width + self._pen_high_increment * 4
         )
+        self.update_pies_picture()
         self.update()
 
     def set_label_font(self, value):
@@ -590,3 +645,5 @@ class Node(Vertex):
 
         self.prepareGeometryChange()
         self.setRect(-r, -r, 2 * r, 2 * r)
+        self.update_geometry()
+        self.update_pies_picture()
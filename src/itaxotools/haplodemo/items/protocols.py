@@ -44,6 +44,8 @@ class HoverableItem:
         self.set_hovered(False)
 
     def set_hovered(self, value):
+        if value == self._state_hovered:
+            return
         self._state_hovered = value
         super().update()
 
@@ -40,16 +40,14 @@ class PivotHandle(HighlightableItem, SoloMovableItem, QtWidgets.QGraphicsEllipse
 
     @override
     def boundingRect(self):
-        rect = super().boundingRect()
-        width = rect.width()
-        height = rect.height()
-        rect.setWidth(width * 2)
-        rect.setHeight(height * 2)
-        rect.translate(-width, -height)
-        return super().boundingRect()
+        # Include the crosshair lines and the highlighted pen
+        rect = self.rect()
+        extra = rect.width() / 2 + self._pen_high.widthF()
+        return rect.adjusted(-extra, -extra, extra, extra)
 
     @override
     def paint(self, painter, option, widget=None):
+        painter.setBrush(QtCore.Qt.NoBrush)
         if self.is_highlighted():
             painter.setPen(self._pen_high)
             self.paint_pivot(painter)
@@ -115,6 +113,7 @@ class PivotHandle(HighlightableItem, SoloMovableItem, QtWidgets.QGraphicsEllipse
         self.setRect(rect)
 
     def update_pens(self):
+        self.prepareGeometryChange()
         self._pen = QtGui.QPen(QtCore.Qt.black, 1 / self.scale)
         self._pen_high = QtGui.QPen(self.highlight_color(), 4 / self.scale)
         self._pen_high.setCapStyle(QtCore.Qt.RoundCap)
@@ -50,7 +50,9 @@ class Scale(HighlightableItem, SoloMovableItemWithHistory, QtWidgets.QGraphicsIt
 
     @override
     def boundingRect(self):
-        return QtCore.QRect(0, -self.radius, self.radius * 2, self.radius)
+        # Include the pen, highlighted arcs also have round caps
+        m = (self._pen_width + self._pen_high_increment) / 2 + 1
+        return QtCore.QRectF(self.get_arcs_rect()).adjusted(-m, -m, m, m)
 
     @override
     def shape(self):
@@ -63,6 +65,7 @@ class Scale(HighlightableItem, SoloMovableItemWithHistory, QtWidgets.QGraphicsIt
 
     @override
     def paint(self, painter, options, widget=None):
+        painter.setBrush(QtCore.Qt.NoBrush)
         if self.is_highlighted():
             painter.setPen(self._pen_high)
             self.paint_marks(painter)
@@ -106,6 +109,7 @@ class Scale(HighlightableItem, SoloMovableItemWithHistory, QtWidgets.QGraphicsIt
             label.set_highlight_color(value)
 
     def set_pen_width(self, value):
+        self.prepareGeometryChange()
         self._pen_width = value
         self.update_pens()
 
@@ -115,11 +119,15 @@ class Scale(HighlightableItem, SoloMovableItemWithHistory, QtWidgets.QGraphicsIt
             self.highlight_color(), self._pen_width + self._pen_high_increment
         )
         self._pen_high.setCapStyle(QtCore.Qt.RoundCap)
+        self.update()
+
+    def get_arcs_rect(self):
+        return QtCore.QRect(0, -self.radius, self.radius * 2, self.radius)
 
     def get_extended_rect(self):
-        rect = self.boundingRect()
+        rect = self.get_arcs_rect()
         for label in self.labels:
-            label_rect = label.boundingRect()
+            label_rect = QtCore.QRect(label.rect)
             label_rect.translate(label.pos().toPoint())
             rect = rect.united(label_rect)
         return rect
@@ -139,6 +147,7 @@ class Scale(HighlightableItem, SoloMovableItemWithHistory, QtWidgets.QGraphicsIt
         marks = self.marks or [1]
         radius_for_weight = self.settings.node_sizes.radius_for_weight
         radii = [radius_for_weight(size) for size in marks]
+        self.prepareGeometryChange()
         self.radii = radii
         self.radius = max(radii)
         self.place_labels()
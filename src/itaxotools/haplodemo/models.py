@@ -25,7 +25,8 @@ from collections import defaultdict
 from itaxotools.common.utility import override
 
 from .palettes import Palette
-from .types import Division, MemberItem, Partition
+from .types import ColorMap, Division, MemberItem, Partition
+from .utility import colorFromString
 
 
 class PartitionListModel(QtCore.QAbstractListModel):
@@ -74,11 +75,29 @@ class DivisionListModel(QtCore.QAbstractListModel):
     colorMapChanged = QtCore.Signal(object)
     divisionsChanged = QtCore.Signal(object)
 
+    _flags = (
+        QtCore.Qt.ItemIsEditable | QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+    )
+    _roles = frozenset(
+        [QtCore.Qt.DisplayRole, QtCore.Qt.EditRole, QtCore.Qt.DecorationRole]
+    )
+
     def __init__(self, names=[], palette=Palette.Spring(), parent=None):
         super().__init__(parent)
         self._palette = palette
         self._default_color = palette.default
         self._divisions = list()
+        self._icons: dict[str, QtGui.QIcon] = {}
+        self._color_map: ColorMap = None
+        self._color_map_emitted: ColorMap = None
+        self._color_map_diverged = False
+
+        # Batch edits into a single broadcast on the next event loop pass
+        self._color_map_timer = QtCore.QTimer(self)
+        self._color_map_timer.setSingleShot(True)
+        self._color_map_timer.setInterval(0)
+        self._color_map_timer.timeout.connect(self.emit_color_map)
+
         self.set_divisions_from_keys(names)
         self.set_palette(palette)
 
@@ -91,23 +110,20 @@ class DivisionListModel(QtCore.QAbstractListModel):
 
     @override
     def data(self, index, role=QtCore.Qt.DisplayRole):
-        if not index.isValid() or not (0 <= index.row() < self.rowCount()):
+        # Views ask for many roles we don't provide, so reject those first
+        if role not in self._roles:
             return None
 
-        key = self._divisions[index.row()].key
-        color = self._divisions[index.row()].color
+        if not index.isValid() or not (0 <= index.row() < len(self._divisions)):
+            return None
+
+        division = self._divisions[index.row()]
 
         if role == QtCore.Qt.DisplayRole:
-            return key
-        elif role == QtCore.Qt.EditRole:
-            return color
+            return division.key
         elif role == QtCore.Qt.DecorationRole:
-            color = QtGui.QColor(color)
-            pixmap = QtGui.QPixmap(16, 16)
-            pixmap.fill(color)
-            return QtGui.QIcon(pixmap)
-
-        return None
+            return self.get_icon(division.color)
+        return division.color
 
     @override
     def setData(self, index, value, role=QtCore.Qt.EditRole):
@@ -119,10 +135,12 @@ class DivisionListModel(QtCore.QAbstractListModel):
             if not color.startswith("#"):
                 color = "#" + color
 
-            if not QtGui.QColor.isValidColor(color):
+            # Parsed into the shared cache, so consumers won't parse it again
+            if not colorFromString(color).isValid():
                 return False
 
             self._divisions[index.row()].color = color
+            self._color_map = None
             self.dataChanged.emit(index, index)
             return True
 
@@ -130,32 +148,58 @@ class DivisionListModel(QtCore.QAbstractListModel):
 
     @override
     def flags(self, index):
-        return (
-            QtCore.Qt.ItemIsEditable
-            | QtCore.Qt.ItemIsEnabled
-            | QtCore.Qt.ItemIsSelectable
-        )
+        return self._flags
+
+    def get_icon(self, color: str) -> QtGui.QIcon:
+        if color not in self._icons:
+            pixmap = QtGui.QPixmap(16, 16)
+            pixmap.fill(colorFromString(color))
+            self._icons[color] = QtGui.QIcon(pixmap)
+        return self._icons[color]
 
     def set_divisions_from_keys(self, keys):
         self.beginResetModel()
-        palette = self._palette
-        self._divisions = [Division(keys[i], palette[i]) for i in range(len(keys))]
+        colors = self._palette.padded()
+        self._divisions = [Division(key, color) for key, color in zip(keys, colors)]
+        self._color_map = None
         self.endResetModel()
         self.divisionsChanged.emit(self.all())
 
     def set_palette(self, palette):
-        self.beginResetModel()
+        # Only colors change, so keep views intact instead of resetting
         self._default_color = palette.default
-        for index, division in enumerate(self._divisions):
-            division.color = palette[index]
-        self.endResetModel()
+        for division, color in zip(self._divisions, palette.padded()):
+            division.color = color
+        self._color_map = None
+        if not self._divisions:
+            self.handle_data_changed()
+            return
+        top = self.index(0)
+        bottom = self.index(len(self._divisions) - 1)
+        roles = [QtCore.Qt.EditRole, QtCore.Qt.DecorationRole]
+        self.dataChanged.emit(top, bottom, roles)
 
     def get_color_map(self):
-        map = {d.key: d.color for d in self._divisions}
-        return defaultdict(lambda: self._default_color, map)
+        # Built once per change, as every node asks for it when created
+        if self._color_map is None:
+            map = {d.key: d.color for d in self._divisions}
+            self._color_map = ColorMap(self._default_color, map)
+            if self._color_map != self._color_map_emitted:
+                self._color_map_diverged = True
+        return self._color_map
 
     def handle_data_changed(self, *args, **kwargs):
-        self.colorMapChanged.emit(self.get_color_map())
+        self._color_map_timer.start()
+
+    @QtCore.Slot()
+    def emit_color_map(self):
+        # Skip if no map differing from the last broadcast was handed out
+        color_map = self.get_color_map()
+        if not self._color_map_diverged:
+            return
+        self._color_map_diverged = False
+        self._color_map_emitted = color_map
+        self.colorMapChanged.emit(color_map)
 
     def all(self):
         return list(self._divisions)
@@ -16,6 +16,9 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # -----------------------------------------------------------------------------
 
+from collections.abc import Iterator
+from itertools import chain, repeat
+
 from itaxotools.common.types import Type
 
 
@@ -33,6 +36,10 @@ class Palette(list, Type):
             return super().__getitem__(index)
         return self.default
 
+    def padded(self) -> Iterator[str]:
+        """Iterate over all colors, then keep yielding the default"""
+        return chain(self, repeat(self.default))
+
 
 class Set1(Palette):
     label = "Set1"
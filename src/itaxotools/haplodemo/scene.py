@@ -18,12 +18,15 @@
 
 from __future__ import annotations
 
-from PySide6 import QtCore, QtGui, QtOpenGLWidgets, QtSvg, QtWidgets
+from PySide6 import QtCore, QtGui, QtWidgets
 
 from contextlib import contextmanager
+from functools import partial
 from math import cos, radians, sin
+from typing import Callable
 
 from itaxotools.common.bindings import Binder
+from itaxotools.common.utility import override
 
 from .history import (
     BezierEditCommand,
@@ -69,8 +72,15 @@ class GraphicsScene(QtWidgets.QGraphicsScene):
         self.pivot = None
 
         self._view_scale = None
+        self._index_dropped = False
         self.rotating = False
 
+        self._pending_boxes: set[RectBox] = set()
+        self._boxes_timer = QtCore.QTimer(self)
+        self._boxes_timer.setSingleShot(True)
+        self._boxes_timer.setInterval(16)
+        self._boxes_timer.timeout.connect(self.adjust_pending_boxes)
+
         self.binder = Binder()
         self.reset_binder()
 
@@ -85,19 +95,20 @@ class GraphicsScene(QtWidgets.QGraphicsScene):
             return False
 
         if event.type() == QtCore.QEvent.GraphicsSceneMouseMove:
-            if self.getItemAtPosByType(event.scenePos(), PivotHandle):
+            if self.is_pivot_at(event.scenePos()):
                 self.pivot.set_hovered(True)
                 return False
 
             self.pivot.set_hovered(False)
             if self.rotating:
+                self.drop_index()
                 vertices = (item for item in self.items() if isinstance(item, Vertex))
                 for vertex in vertices:
                     vertex.moveRotationally(event)
             return True
 
         elif event.type() == QtCore.QEvent.GraphicsSceneMousePress:
-            if self.getItemAtPosByType(event.scenePos(), PivotHandle):
+            if self.is_pivot_at(event.scenePos()):
                 return False
 
             center = self.pivot.pos()
@@ -115,26 +126,52 @@ class GraphicsScene(QtWidgets.QGraphicsScene):
             for vertex in vertices:
                 vertex.in_scene_rotation = False
             self.rotating = False
+            self.restore_index()
             return True
 
         return False
 
+    def mouseMoveEvent(self, event):
+        if event.buttons() and isinstance(self.mouseGrabberItem(), Vertex):
+            self.drop_index()
+        super().mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        super().mouseReleaseEvent(event)
+        if not self.mouseGrabberItem():
+            self.restore_index()
+
+    def drop_index(self):
+        # Dragged nodes move their edges and labels along with them,
+        # keeping the BSP tree up to date costs more than linear scans
+        if self.itemIndexMethod() == QtWidgets.QGraphicsScene.NoIndex:
+            return
+        self.setItemIndexMethod(QtWidgets.QGraphicsScene.NoIndex)
+        self._index_dropped = True
+
+    def restore_index(self):
+        if not self._index_dropped:
+            return
+        self.setItemIndexMethod(QtWidgets.QGraphicsScene.BspTreeIndex)
+        self._index_dropped = False
+
     def getItemAtPosByType(self, pos, *types):
         if not types:
-            types = [QtWidgets.QGraphicsItem]
-        for item in self.items(pos):
-            if any((isinstance(item, type) for type in types)):
-                return item
-        return None
+            types = (QtWidgets.QGraphicsItem,)
+        return next((item for item in self.items(pos) if isinstance(item, types)), None)
+
+    def is_pivot_at(self, pos: QtCore.QPointF) -> bool:
+        pivot = self.pivot
+        if not pivot or not pivot.isVisible():
+            return False
+        return pivot.contains(pivot.mapFromScene(pos))
 
     def getItemAtPosByTypeExcluded(self, pos, *types):
         if not types:
             raise TypeError("Must provide at least one type")
-        for item in self.items(pos):
-            if any((isinstance(item, type) for type in types)):
-                continue
-            return item
-        return None
+        return next(
+            (item for item in self.items(pos) if not isinstance(item, types)), None
+        )
 
     def set_boundary_rect(self, x=0, y=0, w=0, h=0):
         if not self.boundary:
@@ -366,6 +403,18 @@ class GraphicsScene(QtWidgets.QGraphicsScene):
         show_isolated = self.settings.fields.show_isolated
         self.set_boxes_visible(show_groups, show_isolated)
 
+    def schedule_box_adjustment(self, box: RectBox):
+        # Boxes are fitted at most once per frame while nodes are dragged
+        self._pending_boxes.add(box)
+        if not self._boxes_timer.isActive():
+            self._boxes_timer.start()
+
+    def adjust_pending_boxes(self):
+        self._boxes_timer.stop()
+        for box in self._pending_boxes:
+            box.adjust_position()
+        self._pending_boxes.clear()
+
     def style_edges(self, style_default=EdgeStyle.Bubbles, cutoff=3):
         if not cutoff:
             cutoff = float("inf")
@@ -377,14 +426,19 @@ class GraphicsScene(QtWidgets.QGraphicsScene):
         edges = (item for item in self.items() if isinstance(item, Edge))
 
         for edge in edges:
-            style = style_default if edge.segments <= cutoff else style_cutoff
             edge.lock_style()
-            edge.set_style(style)
+            edge.set_style(style_default if edge.segments <= cutoff else style_cutoff)
 
     def style_nodes(self):
-        nodes = (item for item in self.items() if isinstance(item, Node))
-        edges = (item for item in self.items() if isinstance(item, Edge))
-        boxes = (item for item in self.items() if isinstance(item, RectBox))
+        # Sort items in a single pass, nodes must be resized before the rest
+        nodes, edges, boxes = [], [], []
+        for item in self.items():
+            if isinstance(item, Node):
+                nodes.append(item)
+            elif isinstance(item, Edge):
+                edges.append(item)
+            elif isinstance(item, RectBox):
+                boxes.append(item)
         for node in nodes:
             node.adjust_radius()
         for edge in edges:
@@ -399,14 +453,13 @@ class GraphicsScene(QtWidgets.QGraphicsScene):
         edge_label_format = self.settings.edge_label_template.replace(
             "WEIGHT", "{weight}"
         )
-        nodes = (item for item in self.items() if isinstance(item, Node))
-        edges = (item for item in self.items() if isinstance(item, Edge))
-        for node in nodes:
-            text = node_label_format.format(name=node.name, weight=node.weight)
-            node.label.setText(text)
-        for edge in edges:
-            text = edge_label_format.format(weight=edge.weight)
-            edge.label.setText(text)
+        for item in self.items():
+            if isinstance(item, Node):
+                text = node_label_format.format(name=item.name, weight=item.weight)
+                item.label.setText(text)
+            elif isinstance(item, Edge):
+                text = edge_label_format.format(weight=item.weight)
+                item.label.setText(text)
 
     def get_marks_from_nodes(self):
         weights = set()
@@ -427,6 +480,7 @@ class GraphicsScene(QtWidgets.QGraphicsScene):
         marks = self.get_marks_from_nodes()
         self.settings.scale.marks = marks
 
+    @QtCore.Slot(float)
     def handle_view_scaled(self, scale):
         self._view_scale = scale
         if self.pivot:
@@ -476,7 +530,10 @@ class GraphicsScene(QtWidgets.QGraphicsScene):
         )
 
     def clear(self):
+        self._boxes_timer.stop()
+        self._pending_boxes.clear()
         super().clear()
+        self.setSceneRect(QtCore.QRectF())
         self.boundary = None
         self.legend = None
         self.scale = None
@@ -493,6 +550,8 @@ class GraphicsScene(QtWidgets.QGraphicsScene):
 class GraphicsView(QtWidgets.QGraphicsView):
     scaled = QtCore.Signal(float)
     rotating = QtCore.Signal(bool)
+    exportFinished = QtCore.Signal(str)
+    exportFailed = QtCore.Signal(str, str)
 
     def __init__(self, scene=None, opengl=False, parent=None):
         super().__init__(parent)
@@ -503,6 +562,7 @@ class GraphicsView(QtWidgets.QGraphicsView):
         self.zoom_minimum = 0.1
         self.rotate_mode = False
         self.rotating = False
+        self._export_task: ExportTask = None
 
         self.setScene(scene)
 
@@ -511,7 +571,8 @@ class GraphicsView(QtWidgets.QGraphicsView):
         self.setDragMode(QtWidgets.QGraphicsView.NoDrag)
         self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOn)
         self.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOn)
-        self.setViewportUpdateMode(QtWidgets.QGraphicsView.FullViewportUpdate)
+        self.setViewportUpdateMode(QtWidgets.QGraphicsView.MinimalViewportUpdate)
+        self.setOptimizationFlags(QtWidgets.QGraphicsView.DontSavePainterState)
         self.setTransformationAnchor(QtWidgets.QGraphicsView.AnchorUnderMouse)
         # self.setMouseTracking(True)
 
@@ -549,6 +610,8 @@ class GraphicsView(QtWidgets.QGraphicsView):
             +2 * rect.height(),
         )
         self.setSceneRect(rect)
+        # Spare the scene from growing its rect and index with every change
+        self.scene().setSceneRect(rect)
 
     def setScale(self, scale):
         current_scale = self.transform().m11()
@@ -606,20 +669,17 @@ class GraphicsView(QtWidgets.QGraphicsView):
         self.verticalScrollBar().setValue(yy - event.angleDelta().y())
 
     def mousePressEvent(self, event):
-        pos = self.mapToScene(event.pos())
-        item = self.scene().getItemAtPosByTypeExcluded(
-            pos, BoundaryRect, BoundaryOutline, RectBox
-        )
         if event.button() == QtCore.Qt.LeftButton:
+            pos = self.mapToScene(event.pos())
             if self.rotate_mode:
                 self.rotating = True
-                pos = self.mapToScene(event.pos())
-                pivot = self.scene().getItemAtPosByType(pos, PivotHandle)
-                if pivot:
+                if self.scene().is_pivot_at(pos):
                     self.viewport().setCursor(QtCore.Qt.ArrowCursor)
                 else:
                     self.viewport().setCursor(QtCore.Qt.ClosedHandCursor)
-            elif not item:
+            elif not self.scene().getItemAtPosByTypeExcluded(
+                pos, BoundaryRect, BoundaryOutline, RectBox
+            ):
                 self.setDragMode(QtWidgets.QGraphicsView.ScrollHandDrag)
 
         super().mousePressEvent(event)
@@ -642,9 +702,8 @@ class GraphicsView(QtWidgets.QGraphicsView):
 
         if self.rotate_mode:
             pos = self.mapToScene(event.pos())
-            pivot = self.scene().getItemAtPosByType(pos, PivotHandle)
             grabber = self.scene().mouseGrabberItem()
-            if grabber or pivot:
+            if grabber or self.scene().is_pivot_at(pos):
                 self.viewport().setCursor(QtCore.Qt.ArrowCursor)
             elif self.rotating:
                 self.viewport().setCursor(QtCore.Qt.ClosedHandCursor)
@@ -665,6 +724,7 @@ class GraphicsView(QtWidgets.QGraphicsView):
     def lock_center(self):
         self.locked_center = self.mapToScene(self.viewport().rect().center())
 
+    @QtCore.Slot(bool)
     def handle_rotate_mode_changed(self, value):
         self.rotate_mode = value
         if value:
@@ -673,6 +733,9 @@ class GraphicsView(QtWidgets.QGraphicsView):
             self.viewport().setCursor(QtCore.Qt.ArrowCursor)
 
     def enable_opengl(self):
+        # Only load the OpenGL module when it is actually used
+        from PySide6 import QtOpenGLWidgets
+
         format = QtGui.QSurfaceFormat()
         format.setVersion(3, 3)
         format.setProfile(QtGui.QSurfaceFormat.CoreProfile)
@@ -681,6 +744,12 @@ class GraphicsView(QtWidgets.QGraphicsView):
         format.setStencilBufferSize(8)
         format.setSamples(8)
 
+        # Keep the raster viewport if no such context can be had
+        context = QtGui.QOpenGLContext()
+        context.setFormat(format)
+        if not context.create():
+            return
+
         glwidget = QtOpenGLWidgets.QOpenGLWidget()
         glwidget.setFormat(format)
         self.setViewport(glwidget)
@@ -691,10 +760,12 @@ class GraphicsView(QtWidgets.QGraphicsView):
         """Make sure the scene is clean and ready for a snapshot"""
 
         self.check_file_busy(file)
+        self.scene().adjust_pending_boxes()
 
         selection = []
         beziers_with_controls = []
         hovered_items = []
+        cached_items = []
 
         try:
             white = QtCore.Qt.white
@@ -726,9 +797,21 @@ class GraphicsView(QtWidgets.QGraphicsView):
             if self.scene().boundary:
                 self.scene().boundary.setVisible(False)
 
+            # Cached items would be rasterized in vector exports
+            cached_items = [
+                (item, item.cacheMode())
+                for item in self.scene().items()
+                if item.cacheMode() != QtWidgets.QGraphicsItem.NoCache
+            ]
+            for item, _ in cached_items:
+                item.setCacheMode(QtWidgets.QGraphicsItem.NoCache)
+
             yield
 
         finally:
+            for item, mode in cached_items:
+                item.setCacheMode(mode)
+
             if self.scene().boundary:
                 self.scene().boundary.setVisible(True)
 
@@ -747,17 +830,17 @@ class GraphicsView(QtWidgets.QGraphicsView):
             mid = QtWidgets.QApplication.instance().palette().mid()
             self.scene().setBackgroundBrush(mid)
 
-    def get_render_rects(self) -> tuple[QtCore.QRect, QtCore.QRect]:
-        """Return a tuple of rects for rendering: (target, source)"""
+    def get_render_rects(self) -> tuple[QtCore.QRect, QtCore.QRectF]:
+        """Return a tuple of rects for rendering: (target, scene source)"""
         if self.scene().boundary:
             source = self.scene().boundary.rect()
         else:
-            source = self.viewport().rect()
+            source = self.mapToScene(self.viewport().rect()).boundingRect()
 
-        scale = self.transform().m11()
-
-        source = self.mapFromScene(source).boundingRect()
-        target = QtCore.QRect(0, 0, source.width() / scale, source.height() / scale)
+        # Grow the source to whole pixels, so nothing is clipped or rescaled
+        aligned = source.toAlignedRect()
+        source = QtCore.QRectF(aligned)
+        target = QtCore.QRect(0, 0, aligned.width(), aligned.height())
 
         return (target, source)
 
@@ -774,49 +857,171 @@ class GraphicsView(QtWidgets.QGraphicsView):
         if not ok:
             raise Exception(f"Unable to paint file: {repr(file)}")
 
-    def export_svg(self, file: str):
-        with self.prepare_export(file):
-            target, source = self.get_render_rects()
-
-            generator = QtSvg.QSvgGenerator()
-            generator.setFileName(file)
-            generator.setSize(QtCore.QSize(target.width(), target.height()))
-            generator.setViewBox(target)
-
-            painter = QtGui.QPainter()
-            ok = painter.begin(generator)
-            self.check_painter_begin(ok, file)
-            self.render(painter, target, source)
-            painter.end()
-
-    def export_pdf(self, file: str):
-        with self.prepare_export(file):
-            target, source = self.get_render_rects()
-            size = QtCore.QSizeF(target.width(), target.height())
-            page_size = QtGui.QPageSize(size, QtGui.QPageSize.Unit.Point)
+    def begin_painter(self, device: QtGui.QPaintDevice, file: str) -> QtGui.QPainter:
+        painter = QtGui.QPainter()
+        ok = painter.begin(device)
+        self.check_painter_begin(ok, file)
+        return painter
+
+    def record_scene(self) -> tuple[QtGui.QPicture, QtCore.QRect]:
+        """Record the scene once, so it can be replayed to multiple devices"""
+        target, source = self.get_render_rects()
+
+        picture = QtGui.QPicture()
+        painter = QtGui.QPainter()
+        painter.begin(picture)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        self.scene().render(painter, target, source)
+        painter.end()
+
+        return (picture, target)
+
+    def play_picture(self, painter: QtGui.QPainter, picture: QtGui.QPicture):
+        """Pictures are scaled to the device resolution, undo that"""
+        device = painter.device()
+        sx = picture.logicalDpiX() / device.logicalDpiX()
+        sy = picture.logicalDpiY() / device.logicalDpiY()
+        painter.scale(sx, sy)
+        painter.drawPicture(0, 0, picture)
+
+    def write_svg(self, picture: QtGui.QPicture, target: QtCore.QRect, file: str):
+        from PySide6 import QtSvg
+
+        generator = QtSvg.QSvgGenerator()
+        generator.setFileName(file)
+        generator.setSize(QtCore.QSize(target.width(), target.height()))
+        generator.setViewBox(target)
+
+        painter = self.begin_painter(generator, file)
+        self.play_picture(painter, picture)
+        painter.end()
+
+    def write_pdf(self, picture: QtGui.QPicture, target: QtCore.QRect, file: str):
+        size = QtCore.QSizeF(target.width(), target.height())
+        page_size = QtGui.QPageSize(size, QtGui.QPageSize.Unit.Point)
+
+        writer = QtGui.QPdfWriter(file)
+        writer.setPageSize(page_size)
+
+        painter = self.begin_painter(writer, file)
+        device = QtCore.QSize(writer.width(), writer.height())
+        size = target.size().scaled(device, QtCore.Qt.KeepAspectRatio)
+        painter.setViewport(QtCore.QRect(QtCore.QPoint(0, 0), size))
+        painter.setWindow(target)
+        self.play_picture(painter, picture)
+        painter.end()
+
+    def write_png(
+        self,
+        picture: QtGui.QPicture,
+        target: QtCore.QRect,
+        file: str,
+        scale: float = 1.0,
+    ):
+        image = QtGui.QImage(
+            round(target.width() * scale),
+            round(target.height() * scale),
+            QtGui.QImage.Format_RGB32,
+        )
+        image.fill(QtCore.Qt.white)
 
-            writer = QtGui.QPdfWriter(file)
-            writer.setPageSize(page_size)
+        painter = self.begin_painter(image, file)
+        painter.scale(scale, scale)
+        self.play_picture(painter, picture)
+        painter.end()
 
-            painter = QtGui.QPainter()
-            ok = painter.begin(writer)
-            self.check_painter_begin(ok, file)
-            self.render(painter, QtCore.QRect(), source)
-            painter.end()
+        if not image.save(file, "PNG"):
+            raise Exception(f"Unable to save file: {repr(file)}")
 
-    def export_png(self, file: str):
+    def export_with(self, writer: Callable, file: str, **kwargs):
         with self.prepare_export(file):
-            target, source = self.get_render_rects()
+            picture, target = self.record_scene()
+        writer(picture, target, file, **kwargs)
 
-            pixmap = QtGui.QPixmap(target.width(), target.height())
-            pixmap.fill(QtCore.Qt.white)
+    def export_svg(self, file: str):
+        self.export_with(self.write_svg, file)
 
-            painter = QtGui.QPainter()
-            ok = painter.begin(pixmap)
-            self.check_painter_begin(ok, file)
-            painter.setRenderHint(QtGui.QPainter.Antialiasing)
-            self.render(painter, target, source)
-            painter.end()
+    def export_pdf(self, file: str):
+        self.export_with(self.write_pdf, file)
+
+    def export_png(self, file: str, scale: float = 1.0):
+        """Scale is applied while painting, for sharper high resolution images"""
+        self.export_with(self.write_png, file, scale=scale)
+
+    def export_in_background(
+        self,
+        svg: str | None = None,
+        pdf: str | None = None,
+        png: str | None = None,
+        png_scale: float = 1.0,
+    ):
+        """Record the scene on the GUI thread, then write files from the pool"""
+        writers = [
+            (writer, file)
+            for writer, file in [
+                (self.write_svg, svg),
+                (self.write_pdf, pdf),
+                (partial(self.write_png, scale=png_scale), png),
+            ]
+            if file
+        ]
+        if not writers:
+            return
 
-            self.scene().boundary.setVisible(True)
-            pixmap.save(file)
+        # Tasks writing the same files at once would corrupt them
+        if self._export_task is not None:
+            raise Exception("Another export is still in progress")
+
+        for _, file in writers:
+            self.check_file_busy(file)
+
+        with self.prepare_export(writers[0][1]):
+            picture, target = self.record_scene()
+
+        task = ExportTask(picture, target, writers)
+        task.signals.finished.connect(self.exportFinished)
+        task.signals.failed.connect(self.exportFailed)
+        task.signals.done.connect(self.handle_export_done)
+        self._export_task = task
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def is_exporting(self) -> bool:
+        return self._export_task is not None
+
+    @QtCore.Slot()
+    def handle_export_done(self):
+        self._export_task = None
+
+
+class ExportSignals(QtCore.QObject):
+    finished = QtCore.Signal(str)
+    failed = QtCore.Signal(str, str)
+    done = QtCore.Signal()
+
+
+class ExportTask(QtCore.QRunnable):
+    """Replay a recorded scene to each file, signaling as it goes"""
+
+    def __init__(
+        self,
+        picture: QtGui.QPicture,
+        target: QtCore.QRect,
+        writers: list[tuple[Callable, str]],
+    ):
+        super().__init__()
+        # Owned by the task, so emitting never touches a closed view
+        self.signals = ExportSignals()
+        self.picture = picture
+        self.target = target
+        self.writers = writers
+
+    @override
+    def run(self):
+        for writer, file in self.writers:
+            try:
+                writer(self.picture, self.target, file)
+            except Exception as exception:
+                self.signals.failed.emit(file, str(exception))
+            else:
+                self.signals.finished.emit(file)
+        self.signals.done.emit()
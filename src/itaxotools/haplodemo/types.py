@@ -18,6 +18,26 @@ class Division:
     color: str
 
 
+class ColorMap(dict):
+    def __init__(self, default: str, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.default = default
+
+    def __missing__(self, key):
+        return self.default
+
+    def __eq__(self, other):
+        if not isinstance(other, ColorMap):
+            return NotImplemented
+        return self.default == other.default and super().__eq__(other)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return NotImplemented
+        return not equal
+
+
 class LayoutType(Enum):
     ModifiedSpring = auto()
     Spring = auto()
@@ -18,6 +18,14 @@
 
 from PySide6 import QtCore, QtGui
 
+# Shared by all items, they are never modified in place
+DEFAULT_PEN = QtGui.QPen(QtCore.Qt.black, 2)
+
+LABEL_FONT = QtGui.QFont()
+LABEL_FONT.setPixelSize(16)
+LABEL_FONT.setFamily("Arial")
+LABEL_FONT.setHintingPreference(QtGui.QFont.PreferNoHinting)
+
 
 def shapeFromPath(path: QtGui.QPainterPath, pen: QtGui.QPen):
     # reimplement qt_graphicsItem_shapeFromPath
@@ -35,3 +43,20 @@ def shapeFromPath(path: QtGui.QPainterPath, pen: QtGui.QPen):
     p = ps.createStroke(path)
     p.addPath(path)
     return p
+
+
+_colors: dict[str, QtGui.QColor] = {}
+_brushes: dict[str, QtGui.QBrush] = {}
+
+
+def colorFromString(color: str) -> QtGui.QColor:
+    # palettes are small, so parse each color string only once
+    if color not in _colors:
+        _colors[color] = QtGui.QColor(color)
+    return _colors[color]
+
+
+def brushFromString(color: str) -> QtGui.QBrush:
+    if color not in _brushes:
+        _brushes[color] = QtGui.QBrush(colorFromString(color))
+    return _brushes[color]
@@ -23,19 +23,32 @@ from typing import Callable
 from itaxotools.common.utility import override
 
 from .models import DivisionListModel, MemberTreeModel
+from .utility import colorFromString
 
 
 class ColorDelegate(QtWidgets.QStyledItemDelegate):
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        # Reserve room for the swatch, which is painted below instead of
+        # the model's icon, so it is not tinted on selected rows
+        option.icon = QtGui.QIcon()
+        option.features |= QtWidgets.QStyleOptionViewItem.HasDecoration
+        option.decorationSize = QtCore.QSize(16, 16)
+
     def paint(self, painter, option, index):
         super().paint(painter, option, index)
 
-        # Draw the decoration icon on top of the background
-        decoration_rect = QtCore.QRect(
-            option.rect.x() + 2, option.rect.y() + 2, 16, option.rect.height() - 4
+        # Draw the color swatch where the style placed the decoration
+        color = index.data(QtCore.Qt.EditRole)
+        if not color:
+            return
+        opt = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        style = opt.widget.style() if opt.widget else QtWidgets.QApplication.style()
+        decoration_rect = style.subElementRect(
+            QtWidgets.QStyle.SE_ItemViewItemDecoration, opt, opt.widget
         )
-        icon = index.data(QtCore.Qt.DecorationRole)
-        if icon and not icon.isNull():
-            icon.paint(painter, decoration_rect)
+        painter.fillRect(decoration_rect, colorFromString(color))
 
     def createEditor(self, parent, option, index):
         editor = QtWidgets.QColorDialog(parent=parent)
@@ -44,7 +57,7 @@ class ColorDelegate(QtWidgets.QStyledItemDelegate):
 
     def setEditorData(self, editor, index):
         color = index.model().data(index, QtCore.Qt.EditRole)
-        editor.setCurrentColor(QtGui.QColor(color))
+        editor.setCurrentColor(colorFromString(color))
 
     def setModelData(self, editor, model, index):
         model.setData(index, editor.currentColor().name(), QtCore.Qt.EditRole)
@@ -55,8 +68,8 @@ class ColorDelegate(QtWidgets.QStyledItemDelegate):
 
     @staticmethod
     def setCustomColors(palette):
-        for i in range(16):
-            QtWidgets.QColorDialog.setCustomColor(i, QtGui.QColor(palette[i]))
+        for i, color in zip(range(16), palette.padded()):
+            QtWidgets.QColorDialog.setCustomColor(i, QtGui.QColor(color))
 
 
 class DivisionView(QtWidgets.QListView):
@@ -22,11 +22,12 @@ from PySide6 import QtCore, QtWidgets
 
 from collections import Counter, defaultdict
 from itertools import combinations
+from operator import not_
 from typing import Callable
 
 import networkx as nx
 
-from itaxotools.common.bindings import Binder
+from itaxotools.common.bindings import PropertyRef
 from itaxotools.common.utility import Guard
 
 from .items.bezier import BezierCurve
@@ -51,9 +52,11 @@ class Visualizer(QtCore.QObject):
         self.scene = scene
         self.settings = settings
 
-        self.binder = Binder()
+        self.item_slots: dict[str, dict[Callable, list[Callable]]] = {}
+        self.item_values: dict[str, object] = {}
 
         self.items: dict[str, Vertex] = {}
+        self.nodes: list[Node] = []
         self.members: dict[str, set[str]] = defaultdict(set)
         self.member_indices: dict[str, QtCore.QModelIndex] = defaultdict(
             QtCore.QModelIndex
@@ -65,6 +68,7 @@ class Visualizer(QtCore.QObject):
         self._member_select_guard = Guard()
 
         self.scene.selectionChanged.connect(self.handle_selection_changed)
+        self.settings.divisions.colorMapChanged.connect(self.handle_color_map_changed)
         self.settings.properties.partition_index.notify.connect(
             self.handle_partition_selected
         )
@@ -75,7 +79,9 @@ class Visualizer(QtCore.QObject):
     def clear(self):
         """If visualizer is used, scene should be cleared through here to
         properly unbind settings from older objects"""
-        self.binder.unbind_all()
+        for slots in self.item_slots.values():
+            slots.clear()
+        self.nodes = []
         self.scene.clear()
 
         self.settings.divisions.set_divisions_from_keys([])
@@ -254,7 +260,7 @@ class Visualizer(QtCore.QObject):
             if not isinstance(item, Node):
                 continue
             weights = Counter(self.partition[member] for member in self.members[id])
-            item.weights = dict(weights)
+            item.set_weights(dict(weights))
             item.update_colors(color_map)
 
     def visualize_haploweb(self):
@@ -315,78 +321,103 @@ class Visualizer(QtCore.QObject):
             if child not in visited:
                 self._find_group_for_node_dfs(graph, child, visited, group)
 
+    def bind_item(
+        self, property: PropertyRef, slot: Callable, proxy: Callable | None = None
+    ):
+        # Binding every item separately would re-emit the setting
+        # to all previously bound items, so items share one connection
+        key = property.key
+        if key not in self.item_slots:
+            self.item_slots[key] = {}
+            property.notify.connect(lambda value: self._call_slots(key, value))
+            # Values are converted by the signal, so get them through it
+            property.update()
+        self.item_slots[key].setdefault(proxy, []).append(slot)
+        value = self.item_values[key]
+        slot(proxy(value) if proxy else value)
+
+    def _call_slots(self, key: str, value):
+        self.item_values[key] = value
+        for proxy, slots in self.item_slots[key].items():
+            proxied = proxy(value) if proxy else value
+            for slot in slots:
+                slot(proxied)
+
     def create_vertex(self, *args, **kwargs):
         item = Vertex(*args, **kwargs)
-        self.binder.bind(
+        self.bind_item(
             self.settings.properties.snapping_movement, item.set_snapping_setting
         )
-        self.binder.bind(
+        self.bind_item(
             self.settings.properties.rotational_movement, item.set_rotational_setting
         )
-        self.binder.bind(
+        self.bind_item(
             self.settings.properties.recursive_movement, item.set_recursive_setting
         )
-        self.binder.bind(
+        self.bind_item(
             self.settings.properties.highlight_color, item.set_highlight_color
         )
-        self.binder.bind(self.settings.properties.pen_width_edges, item.set_pen_width)
+        self.bind_item(self.settings.properties.pen_width_edges, item.set_pen_width)
         return item
 
     def create_node(self, *args, **kwargs):
         item = Node(*args, **kwargs)
         item.update_colors(self.settings.divisions.get_color_map())
-        self.binder.bind(self.settings.divisions.colorMapChanged, item.update_colors)
-        self.binder.bind(
+        self.nodes.append(item)
+        self.bind_item(
             self.settings.properties.snapping_movement, item.set_snapping_setting
         )
-        self.binder.bind(
+        self.bind_item(
             self.settings.properties.rotational_movement, item.set_rotational_setting
         )
-        self.binder.bind(
+        self.bind_item(
             self.settings.properties.recursive_movement, item.set_recursive_setting
         )
-        self.binder.bind(
+        self.bind_item(
             self.settings.properties.label_movement,
             item.label.set_locked,
-            lambda x: not x,
+            not_,
         )
-        self.binder.bind(
+        self.bind_item(
             self.settings.properties.highlight_color, item.set_highlight_color
         )
-        self.binder.bind(self.settings.properties.pen_width_nodes, item.set_pen_width)
-        self.binder.bind(self.settings.properties.font, item.set_label_font)
+        self.bind_item(self.settings.properties.pen_width_nodes, item.set_pen_width)
+        self.bind_item(self.settings.properties.font, item.set_label_font)
         return item
 
     def create_edge(self, *args, **kwargs):
         item = Edge(*args, **kwargs)
-        self.binder.bind(
+        self.bind_item(
             self.settings.properties.highlight_color, item.set_highlight_color
         )
-        self.binder.bind(
+        self.bind_item(
             self.settings.properties.label_movement,
             item.label.set_locked,
-            lambda x: not x,
+            not_,
         )
-        self.binder.bind(self.settings.properties.pen_width_edges, item.set_pen_width)
-        self.binder.bind(self.settings.properties.font, item.set_label_font)
+        self.bind_item(self.settings.properties.pen_width_edges, item.set_pen_width)
+        self.bind_item(self.settings.properties.font, item.set_label_font)
         return item
 
     def create_rect_box(self, vertices):
         item = RectBox(vertices)
         for vertex in vertices:
             vertex.boxes.append(item)
+            vertex.send_geometry_changes()
         self.scene.addItem(item)
         item.adjust_position()
         return item
 
     def create_bezier(self, node1, node2):
         item = BezierCurve(node1, node2)
-        self.binder.bind(
+        self.bind_item(
             self.settings.properties.highlight_color, item.set_highlight_color
         )
-        self.binder.bind(self.settings.properties.pen_width_edges, item.set_pen_width)
+        self.bind_item(self.settings.properties.pen_width_edges, item.set_pen_width)
         node1.beziers[node2] = item
         node2.beziers[node1] = item
+        node1.send_geometry_changes()
+        node2.send_geometry_changes()
         self.scene.addItem(item)
         return item
 
@@ -408,11 +439,18 @@ class Visualizer(QtCore.QObject):
     def handle_about_to_quit(self):
         self.scene.selectionChanged.disconnect(self.handle_selection_changed)
 
+    @QtCore.Slot(object)
+    def handle_color_map_changed(self, color_map):
+        # One slot for all nodes instead of a connection per node
+        for node in self.nodes:
+            node.update_colors(color_map)
+
     def handle_partition_selected(self, index):
         partition = index.data(PartitionListModel.PartitionRole)
         if partition is not None:
             self.set_partition(partition.map)
 
+    @QtCore.Slot()
     def handle_selection_changed(self):
         selection = self.scene.selectedItems()
         selection = [item for item in selection if isinstance(item, Vertex)]
@@ -67,26 +67,41 @@ class RadioButtonGroup(QtCore.QObject):
 
 
 class ToggleButton(QtWidgets.QPushButton):
+    checkmark = QtGui.QPolygon(
+        [QtCore.QPoint(-3, 0), QtCore.QPoint(-2, 3), QtCore.QPoint(5, -5)]
+    )
+    checkmark_pen = QtGui.QPen(QtGui.QColor("#333"), 1.5)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.setCheckable(True)
-        self.checkmark = QtGui.QPolygon(
-            [QtCore.QPoint(-3, 0), QtCore.QPoint(-2, 3), QtCore.QPoint(5, -5)]
-        )
+        self.update_text_width()
+
+    def setText(self, text):
+        super().setText(text)
+        self.update_text_width()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QtCore.QEvent.FontChange:
+            self.update_text_width()
+
+    def update_text_width(self):
+        m = QtGui.QFontMetrics(self.font())
+        self.text_width = m.boundingRect(self.text()).width()
 
     def paintEvent(self, event):
         super().paintEvent(event)
         if not self.isChecked():
             return
 
-        m = QtGui.QFontMetrics(self.font())
-        w = self.width() - m.boundingRect(self.text()).width()
+        w = self.width() - self.text_width
         w = w / 2 - 14
         h = self.height() / 2 + 1
 
         painter = QtGui.QPainter(self)
         painter.translate(w, h)
-        painter.setPen(QtGui.QPen(QtGui.QColor("#333"), 1.5))
+        painter.setPen(self.checkmark_pen)
         painter.setRenderHint(QtGui.QPainter.Antialiasing)
         painter.drawPolyline(self.checkmark)
         painter.end()
@@ -103,6 +118,7 @@ class PartitionSelector(QtWidgets.QComboBox):
         self.setModel(model)
         self.currentIndexChanged.connect(self.handleIndexChanged)
 
+    @QtCore.Slot(int)
     def handleIndexChanged(self, row: int):
         index = self.model().index(row, 0)
         self.modelIndexChanged.emit(index)
@@ -114,19 +130,21 @@ class PartitionSelector(QtWidgets.QComboBox):
 class PaletteSelector(QtWidgets.QComboBox):
     currentValueChanged = QtCore.Signal(Palette)
 
+    _palettes = tuple(Palette)
+    _palette_indices = {palette: index for index, palette in enumerate(_palettes)}
+
     def __init__(self):
         super().__init__()
-        self._palettes = []
-        for palette in Palette:
-            self._palettes.append(palette)
+        for palette in self._palettes:
             self.addItem(palette.label)
         self.currentIndexChanged.connect(self.handleIndexChanged)
 
+    @QtCore.Slot(int)
     def handleIndexChanged(self, index):
         self.currentValueChanged.emit(self._palettes[index]())
 
     def setValue(self, value):
-        index = self._palettes.index(value.type)
+        index = self._palette_indices[value.type]
         self.setCurrentIndex(index)
 
 
@@ -120,13 +120,13 @@ class Window(QtWidgets.QWidget):
         button_demo_many.setStyleSheet("color: #A00;")
 
         button_svg = QtWidgets.QPushButton("Export as SVG")
-        button_svg.clicked.connect(lambda: self.export_svg())
+        button_svg.clicked.connect(lambda: self.export_as("svg"))
 
         button_pdf = QtWidgets.QPushButton("Export as PDF")
-        button_pdf.clicked.connect(lambda: self.export_pdf())
+        button_pdf.clicked.connect(lambda: self.export_as("pdf"))
 
         button_png = QtWidgets.QPushButton("Export as PNG")
-        button_png.clicked.connect(lambda: self.export_png())
+        button_png.clicked.connect(lambda: self.export_as("png"))
 
         mass_resize_nodes = QtWidgets.QPushButton("Set node size")
         mass_resize_nodes.clicked.connect(self.node_size_dialog.show)
@@ -361,6 +361,9 @@ class Window(QtWidgets.QWidget):
         self.quick_save_action = action
         self.addAction(action)
 
+        self.scene_view.exportFinished.connect(self.handle_export_finished)
+        self.scene_view.exportFailed.connect(self.handle_export_failed)
+
         self.demos.load_demo_simple()
 
     def resizeEvent(self, event):
@@ -375,36 +378,45 @@ class Window(QtWidgets.QWidget):
         self.zoom_control.setGeometry(gg)
 
     def quick_save(self):
-        self.export_svg("graph.svg")
-        self.export_pdf("graph.pdf")
-        self.export_png("graph.png")
+        self.export_files(svg="graph.svg", pdf="graph.pdf", png="graph.png")
 
-    def export_svg(self, file=None):
+    def export_as(
+        self, format: str, file: str | None = None, scale: float | None = None
+    ):
+        interactive = file is None
         if file is None:
             file, _ = QtWidgets.QFileDialog.getSaveFileName(
-                self, "Export As...", "graph.svg", "SVG Files (*.svg)"
+                self,
+                "Export As...",
+                f"graph.{format}",
+                f"{format.upper()} Files (*.{format})",
             )
         if not file:
             return
-        print("SVG >", file)
-        self.scene_view.export_svg(file)
-
-    def export_pdf(self, file=None):
-        if file is None:
-            file, _ = QtWidgets.QFileDialog.getSaveFileName(
-                self, "Export As...", "graph.pdf", "PDF Files (*.pdf)"
-            )
-        if not file:
+        if format != "png":
+            self.export_files(**{format: file})
             return
-        print("PDF >", file)
-        self.scene_view.export_pdf(file)
-
-    def export_png(self, file=None):
-        if file is None:
-            file, _ = QtWidgets.QFileDialog.getSaveFileName(
-                self, "Export As...", "graph.png", "PNG Files (*.png)"
+        if scale is None and interactive:
+            scale, ok = QtWidgets.QInputDialog.getDouble(
+                self, "Haplodemo - PNG scale", "Scale factor:", 1.0, 0.1, 16.0, 2
             )
-        if not file:
-            return
-        print("PNG >", file)
-        self.scene_view.export_png(file)
+            if not ok:
+                return
+        self.export_files(png=file, png_scale=scale or 1.0)
+
+    def export_files(self, png_scale: float = 1.0, **files: str):
+        for format, file in files.items():
+            print(f"{format.upper()} >", file)
+        try:
+            self.scene_view.export_in_background(png_scale=png_scale, **files)
+        except Exception as exception:
+            self.handle_export_failed(", ".join(files.values()), str(exception))
+
+    @QtCore.Slot(str)
+    def handle_export_finished(self, file: str):
+        print("Saved", file)
+
+    @QtCore.Slot(str, str)
+    def handle_export_failed(self, file: str, error: str):
+        print("Failed", file, error)
+        QtWidgets.QMessageBox.warning(self, "Haplodemo - Export failed", error)
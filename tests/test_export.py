@@ -0,0 +1,80 @@
+from PySide6 import QtCore, QtGui
+
+from pytest import raises
+
+from itaxotools.haplodemo.window import Window
+
+
+def export(qapp, window: Window, **files):
+    finished, failed = [], []
+    view = window.scene_view
+    view.exportFinished.connect(finished.append)
+    view.exportFailed.connect(lambda file, error: failed.append(file))
+    view.export_in_background(**files)
+    QtCore.QThreadPool.globalInstance().waitForDone()
+    qapp.processEvents()
+    return finished, failed
+
+
+def test_export_png_size(qapp, tmp_path):
+    window = Window()
+    window.scene.set_boundary_rect(0.5, 0.5, 100.4, 50.6)
+    file = str(tmp_path / "graph.png")
+
+    export(qapp, window, png=file)
+
+    image = QtGui.QImage(file)
+    assert image.size() == QtCore.QSize(101, 52)
+
+
+def test_export_in_background(qapp, tmp_path):
+    window = Window()
+    files = {
+        format: str(tmp_path / f"graph.{format}") for format in ["svg", "pdf", "png"]
+    }
+
+    finished, failed = export(qapp, window, **files)
+
+    assert sorted(finished) == sorted(files.values())
+    assert not failed
+    assert not window.scene_view.is_exporting()
+    for file in files.values():
+        assert QtCore.QFileInfo(file).size() > 0
+
+
+def test_export_in_progress(qapp, tmp_path):
+    window = Window()
+    view = window.scene_view
+    view.export_in_background(png=str(tmp_path / "first.png"))
+
+    with raises(Exception):
+        view.export_in_background(png=str(tmp_path / "second.png"))
+
+    QtCore.QThreadPool.globalInstance().waitForDone()
+    qapp.processEvents()
+    assert not view.is_exporting()
+
+
+def test_export_outlives_view(qapp, tmp_path):
+    window = Window()
+    file = str(tmp_path / "graph.pdf")
+    window.scene_view.export_in_background(pdf=file)
+    window.deleteLater()
+    qapp.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+    QtCore.QThreadPool.globalInstance().waitForDone()
+    qapp.processEvents()
+    assert QtCore.QFileInfo(file).size() > 0
+
+
+def test_export_png_scale(qapp, tmp_path):
+    window = Window()
+    window.scene.set_boundary_rect(0, 0, 100, 50)
+    file = str(tmp_path / "graph.png")
+
+    window.export_as("png", file, scale=2.5)
+    QtCore.QThreadPool.globalInstance().waitForDone()
+    qapp.processEvents()
+
+    image = QtGui.QImage(file)
+    assert image.size() == QtCore.QSize(250, 125)
@@ -0,0 +1,78 @@
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from pytest import mark
+
+from itaxotools.haplodemo.items.labels import Label
+
+
+def render_label(text: str, change: callable, cached: bool):
+    scene = QtWidgets.QGraphicsScene(-50, -50, 100, 100)
+    parent = QtWidgets.QGraphicsRectItem(0, 0, 1, 1)
+    parent.setPen(QtCore.Qt.NoPen)
+    scene.addItem(parent)
+
+    label = Label(text, parent)
+    view = QtWidgets.QGraphicsView(scene)
+    view.resize(200, 200)
+    view.show()
+
+    # Fill the device coordinate cache before the change
+    if cached:
+        view.grab()
+    change(label)
+
+    image = view.grab().toImage()
+    view.close()
+    return image
+
+
+def assert_cache_invalidated(text: str, change: callable):
+    assert render_label(text, change, True) == render_label(text, change, False)
+
+
+@mark.parametrize("old, new", [("12", "21"), ("AB", "BA"), ("H", "N")])
+def test_label_text_cache(qapp, old, new):
+    assert_cache_invalidated(old, lambda label: label.setText(new))
+
+
+def test_label_font_cache(qapp):
+    font = QtGui.QFont()
+    font.setPixelSize(16)
+    font.setFamily("Arial")
+    font.setItalic(True)
+    assert_cache_invalidated("H", lambda label: label.set_font(QtGui.QFont(font)))
+
+
+def test_label_rect_cache(qapp):
+    def change(label: Label):
+        label.setRect(label.rect.translated(5, 5))
+
+    assert_cache_invalidated("H", change)
+
+
+def test_label_move_reuses_cache(qapp):
+    paints = []
+
+    class CountingLabel(Label):
+        def paint(self, painter, options, widget=None):
+            paints.append(self.text)
+            super().paint(painter, options, widget)
+
+    scene = QtWidgets.QGraphicsScene(-50, -50, 100, 100)
+    parent = QtWidgets.QGraphicsRectItem(0, 0, 1, 1)
+    scene.addItem(parent)
+    label = CountingLabel("H", parent)
+    view = QtWidgets.QGraphicsView(scene)
+    view.resize(200, 200)
+    view.show()
+    view.grab()
+    paints.clear()
+
+    label.setRect(label.rect)
+    label.setRect(label.rect.translated(5, 5))
+    view.grab()
+    assert not paints
+
+    label.setText("HH")
+    view.grab()
+    assert paints
@@ -0,0 +1,102 @@
+from PySide6 import QtCore, QtGui
+
+from itaxotools.haplodemo.models import DivisionListModel
+from itaxotools.haplodemo.palettes import Palette
+from itaxotools.haplodemo.types import ColorMap
+
+
+def get_emitted(qapp, model):
+    emitted = []
+    model.colorMapChanged.connect(lambda color_map: emitted.append(color_map))
+    qapp.processEvents()
+    return emitted
+
+
+def test_color_map_equality():
+    assert ColorMap("#000", {"a": "#111"}) == ColorMap("#000", {"a": "#111"})
+    assert ColorMap("#000", {}) != ColorMap("#fff", {})
+    assert ColorMap("#000", {"a": "#111"}) != ColorMap("#000", {"a": "#222"})
+
+
+def test_color_map_default_change(qapp):
+    model = DivisionListModel([])
+    emitted = get_emitted(qapp, model)
+    count = len(emitted)
+
+    model.set_palette(Palette.Set1())
+    qapp.processEvents()
+
+    assert len(emitted) == count + 1
+    assert emitted[-1] == {}
+    assert emitted[-1].default == Palette.Set1.default
+    assert emitted[-1]["missing"] == Palette.Set1.default
+
+
+def test_color_map_unchanged_is_skipped(qapp):
+    model = DivisionListModel(["a", "b"])
+    emitted = get_emitted(qapp, model)
+
+    model.set_divisions_from_keys(["a", "b"])
+    qapp.processEvents()
+    count = len(emitted)
+
+    model.set_divisions_from_keys(["a", "b"])
+    qapp.processEvents()
+
+    assert len(emitted) == count
+
+
+def test_color_map_edits_are_coalesced(qapp):
+    model = DivisionListModel(["a", "b"])
+    emitted = get_emitted(qapp, model)
+
+    model.setData(model.index(0), "#123456")
+    model.setData(model.index(1), "654321")
+    qapp.processEvents()
+
+    assert len(emitted) == 1
+    assert emitted[-1] == {"a": "#123456", "b": "#654321"}
+
+
+def test_color_map_diverged_is_emitted(qapp):
+    model = DivisionListModel(["a", "b"])
+    emitted = get_emitted(qapp, model)
+
+    model.set_divisions_from_keys(["a", "b"])
+    qapp.processEvents()
+    count = len(emitted)
+
+    # Someone picks up an intermediate map before the final one is restored
+    model.set_divisions_from_keys([])
+    intermediate = model.get_color_map()
+    model.set_divisions_from_keys(["a", "b"])
+    qapp.processEvents()
+
+    assert intermediate == {}
+    assert len(emitted) == count + 1
+    assert emitted[-1] == {"a": "#fd7f6f", "b": "#7eb0d5"}
+
+
+def test_division_roles(qapp):
+    model = DivisionListModel(["a"])
+    index = model.index(0)
+
+    assert model.data(index, QtCore.Qt.DisplayRole) == "a"
+    assert model.data(index, QtCore.Qt.EditRole) == "#fd7f6f"
+    assert model.data(index, QtCore.Qt.ToolTipRole) is None
+    assert model.data(model.index(1), QtCore.Qt.DisplayRole) is None
+
+    icon = model.data(index, QtCore.Qt.DecorationRole)
+    assert isinstance(icon, QtGui.QIcon)
+    image = icon.pixmap(16, 16).toImage()
+    assert image.pixelColor(8, 8) == QtGui.QColor("#fd7f6f")
+
+
+def test_division_set_data(qapp):
+    model = DivisionListModel(["a"])
+    index = model.index(0)
+
+    assert model.setData(index, " 123456 ")
+    assert model.data(index, QtCore.Qt.EditRole) == "#123456"
+    assert not model.setData(index, "nonsense")
+    assert model.data(index, QtCore.Qt.EditRole) == "#123456"
@@ -0,0 +1,39 @@
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from itaxotools.haplodemo.models import DivisionListModel
+from itaxotools.haplodemo.views import ColorDelegate, DivisionView
+
+
+def test_color_delegate_swatch(qapp):
+    model = DivisionListModel(["a", "b"])
+    model.setData(model.index(1), "#123456")
+    view = DivisionView(model)
+    view.resize(200, 100)
+    view.show()
+
+    option = QtWidgets.QStyleOptionViewItem()
+    option.initFrom(view.viewport())
+    option.rect = view.visualRect(model.index(1))
+    view.itemDelegate().initStyleOption(option, model.index(1))
+    rect = view.style().subElementRect(
+        QtWidgets.QStyle.SE_ItemViewItemDecoration, option, view
+    )
+
+    image = view.viewport().grab().toImage()
+    assert image.pixelColor(rect.center()) == QtGui.QColor("#123456")
+    view.close()
+
+
+def test_color_delegate_editor(qapp):
+    model = DivisionListModel(["a"])
+    index = model.index(0)
+    delegate = ColorDelegate()
+    editor = delegate.createEditor(None, QtWidgets.QStyleOptionViewItem(), index)
+
+    delegate.setEditorData(editor, index)
+    assert editor.currentColor() == QtGui.QColor("#fd7f6f")
+
+    editor.setCurrentColor(QtGui.QColor("#123456"))
+    delegate.setModelData(editor, model, index)
+    assert model.data(index, QtCore.Qt.EditRole) == "#123456"
+    editor.deleteLater()
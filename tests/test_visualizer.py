@@ -0,0 +1,71 @@
+from PySide6 import QtCore, QtGui
+
+from itaxotools.haplodemo.scene import GraphicsScene
+from itaxotools.haplodemo.settings import Settings
+from itaxotools.haplodemo.visualizer import Visualizer
+
+
+def get_visualizer():
+    settings = Settings()
+    scene = GraphicsScene(settings)
+    return Visualizer(scene, settings)
+
+
+def test_bind_item_shared_connection(qapp):
+    visualizer = get_visualizer()
+    settings = visualizer.settings
+    first, second, proxied = [], [], []
+
+    visualizer.bind_item(settings.properties.pen_width_edges, first.append)
+    visualizer.bind_item(settings.properties.pen_width_edges, second.append)
+    visualizer.bind_item(
+        settings.properties.pen_width_edges, proxied.append, lambda x: x * 10
+    )
+
+    # Later bindings must not re-notify earlier items
+    assert first == [2]
+    assert second == [2]
+    assert proxied == [20]
+
+    settings.pen_width_edges = 3
+
+    assert first == [2, 3]
+    assert second == [2, 3]
+    assert proxied == [20, 30]
+
+
+def test_bind_item_converted_value(qapp):
+    visualizer = get_visualizer()
+    settings = visualizer.settings
+    values = []
+
+    visualizer.bind_item(settings.properties.highlight_color, values.append)
+    settings.highlight_color = QtGui.QColor("#123456")
+
+    assert all(isinstance(value, QtGui.QColor) for value in values)
+    assert values[-1] == QtGui.QColor("#123456")
+
+
+def test_bind_item_clear(qapp):
+    visualizer = get_visualizer()
+    settings = visualizer.settings
+    values = []
+
+    visualizer.bind_item(settings.properties.pen_width_edges, values.append)
+    visualizer.clear()
+    settings.pen_width_edges = 5
+
+    assert values == [2]
+
+
+def test_create_edge_follows_settings(qapp):
+    visualizer = get_visualizer()
+    settings = visualizer.settings
+
+    node1 = visualizer.create_node(0, 0, 1, "a", {})
+    node2 = visualizer.create_node(50, 0, 1, "b", {})
+    edge = visualizer.create_edge(node1, node2, 1)
+    settings.highlight_color = QtGui.QColor(QtCore.Qt.red)
+
+    assert node1.highlight_color() == QtGui.QColor(QtCore.Qt.red)
+    assert edge.highlight_color() == QtGui.QColor(QtCore.Qt.red)